@@ -1,12 +1,27 @@
+# cython: language_level=3
 import sys
 import traceback
-from typing import Optional, Union
+from typing import Optional, Tuple, Union
+
+
+def _locate(exc_tb) -> Tuple[str, int]:
+    """
+    Returns the (file name, line number) of the innermost frame of a traceback.
+    """
+    last_tb = exc_tb
+    while last_tb and last_tb.tb_next:
+        last_tb = last_tb.tb_next
+
+    if last_tb is None:
+        return "<unknown>", -1
+    return last_tb.tb_frame.f_code.co_filename, last_tb.tb_lineno
 
 
 class EstateRAGException(Exception):
     """
     Base exception class for EstateRAG Assistant.
     Captures detailed traceback, file location, and line number for diagnostics.
+    The formatted `traceback_str` is the canonical retained form; live traceback frames are released.
     """
 
     def __init__(self, error_message: Union[str, BaseException], error_details: Optional[object] = None):
@@ -23,13 +38,7 @@ class EstateRAGException(Exception):
         else:
             exc_type, exc_value, exc_tb = sys.exc_info()
 
-        # Traverse to last traceback frame
-        last_tb = exc_tb
-        while last_tb and last_tb.tb_next:
-            last_tb = last_tb.tb_next
-
-        self.file_name = last_tb.tb_frame.f_code.co_filename if last_tb else "<unknown>"
-        self.line_number = last_tb.tb_lineno if last_tb else -1
+        self.file_name, self.line_number = _locate(exc_tb)
 
         # Format traceback
         self.traceback_str = (
@@ -37,6 +46,11 @@ class EstateRAGException(Exception):
             if exc_type and exc_tb else ""
         )
 
+        # Drop live frames (and their locals) now that the traceback is formatted
+        if exc_value is not None:
+            exc_value.__traceback__ = None
+        del exc_type, exc_value, exc_tb
+
         super().__init__(self.__str__())
 
     def __str__(self):
@@ -1,9 +1,169 @@
 import os
+import sys
+import json
+import atexit
+import signal
 import logging
+import threading
+from collections import deque
 from datetime import datetime
+from typing import List, Optional
+import orjson
 import structlog
 
 
+# Logging is configured once per process; later EstateRAGLogger instances share the first sink
+_CONFIGURED = False
+_SINK: Optional["BatchedBytesLogger"] = None
+_CONFIGURE_LOCK = threading.Lock()
+
+
+def _orjson_renderer(_, __, event_dict) -> bytes:
+    """
+    Renders the event dict as JSON bytes; objects orjson cannot serialize fall back to str().
+    Never raises: a log call inside an `except` block must not mask the original error.
+    """
+    try:
+        return orjson.dumps(event_dict, default=str, option=orjson.OPT_NON_STR_KEYS)
+    except TypeError:
+        pass
+
+    # e.g. integers beyond 64 bits or tuple keys; the stdlib encoder coerces what orjson rejects
+    try:
+        return json.dumps(event_dict, default=str, skipkeys=True).encode("utf-8")
+    except (TypeError, ValueError):
+        return orjson.dumps({k: str(v) for k, v in event_dict.items()}, option=orjson.OPT_NON_STR_KEYS)
+
+
+def _write_all(fd: int, buffers: List[bytes]) -> None:
+    """
+    Writes every buffer to the file descriptor, using a single writev() syscall where available.
+    """
+    if hasattr(os, "writev"):
+        total = sum(len(buf) for buf in buffers)
+        written = os.writev(fd, buffers)
+        remaining = b"".join(buffers)[written:] if written < total else b""
+    else:
+        remaining = b"".join(buffers)
+
+    while remaining:
+        remaining = remaining[os.write(fd, remaining):]
+
+
+def _install_sigterm_flush(sink: "BatchedBytesLogger") -> None:
+    """
+    Flushes pending log lines on SIGTERM, then defers to the previously installed handler.
+    """
+    if threading.current_thread() is not threading.main_thread():
+        return
+
+    previous = signal.getsignal(signal.SIGTERM)
+
+    def _handler(signum, frame):
+        # The signal may interrupt a flush on this very thread; waiting on its lock would deadlock
+        sink.flush(blocking=False)
+        if callable(previous):
+            previous(signum, frame)
+        elif previous != signal.SIG_IGN:
+            signal.signal(signum, signal.SIG_DFL)
+            os.kill(os.getpid(), signum)
+
+    signal.signal(signal.SIGTERM, _handler)
+
+
+class BatchedBytesLogger:
+    """
+    structlog logger that echoes each rendered line to the console and batches file writes.
+    File lines are queued and written by a daemon thread, one writev() per batch.
+    The file and the writer thread are created on the first logged line, so processes that
+    only import the logger (e.g. PDF extraction workers) leave no empty log files or threads behind.
+    """
+
+    def __init__(self, file_path: str, console=None, batch_size: int = 64, flush_interval: float = 0.5):
+        self.file_path = file_path
+        self._fd: Optional[int] = None
+        self._console = console
+        self._batch_size = batch_size
+        self._flush_interval = flush_interval
+
+        self._pending = deque()
+        self._wakeup = threading.Event()
+        self._start_lock = threading.Lock()
+        self._drain_lock = threading.Lock()
+        self._console_lock = threading.Lock()
+        self._closed = False
+        self._writer: Optional[threading.Thread] = None
+
+    def _start(self) -> None:
+        with self._start_lock:
+            if self._fd is not None:
+                return
+            self._fd = os.open(self.file_path, os.O_WRONLY | os.O_CREAT | os.O_APPEND, 0o644)
+            if self._closed:
+                return
+
+            self._writer = threading.Thread(target=self._run, name="estate-rag-log-writer", daemon=True)
+            self._writer.start()
+
+            atexit.register(self.close)
+            _install_sigterm_flush(self)
+
+    def msg(self, message: bytes) -> None:
+        if self._fd is None:
+            self._start()
+
+        line = message + b"\n"
+
+        if self._console is not None:
+            with self._console_lock:
+                self._console.write(line)
+                self._console.flush()
+
+        self._pending.append(line)
+        if self._closed:
+            self.flush()
+        elif len(self._pending) >= self._batch_size:
+            self._wakeup.set()
+
+    log = debug = info = warn = warning = msg
+    fatal = failure = err = error = critical = exception = msg
+
+    def flush(self, blocking: bool = True) -> None:
+        """
+        Writes all queued lines to the log file.
+        With blocking=False, returns without writing if another flush is already in progress.
+        """
+        if self._fd is None:
+            return
+        if not self._drain_lock.acquire(blocking):
+            return
+        try:
+            while self._pending:
+                batch = []
+                while self._pending and len(batch) < self._batch_size:
+                    batch.append(self._pending.popleft())
+                _write_all(self._fd, batch)
+        finally:
+            self._drain_lock.release()
+
+    def close(self) -> None:
+        """
+        Stops the background writer and flushes what is left; later lines are written synchronously.
+        """
+        self._closed = True
+        self._wakeup.set()
+        self.flush()
+
+    def _run(self) -> None:
+        while not self._closed:
+            self._wakeup.wait(self._flush_interval)
+            self._wakeup.clear()
+            try:
+                self.flush()
+            except OSError as e:
+                sys.stderr.write(f"EstateRAG log writer failed: {e}\n")
+
+
 class EstateRAGLogger:
     """
     Structured logger for EstateRAG Assistant.
@@ -20,30 +180,28 @@ class EstateRAGLogger:
         self._configure_logging()
 
     def _configure_logging(self):
-        file_handler = logging.FileHandler(self.log_file_path)
-        file_handler.setLevel(logging.INFO)
-        file_handler.setFormatter(logging.Formatter("%(message)s"))
-
-        console_handler = logging.StreamHandler()
-        console_handler.setLevel(logging.INFO)
-        console_handler.setFormatter(logging.Formatter("%(message)s"))
-
-        logging.basicConfig(
-            level=logging.INFO,
-            format="%(message)s",
-            handlers=[console_handler, file_handler]
-        )
-
-        structlog.configure(
-            processors=[
-                structlog.processors.TimeStamper(fmt="iso", utc=True, key="timestamp"),
-                structlog.processors.add_log_level,
-                structlog.processors.EventRenamer(to="event"),
-                structlog.processors.JSONRenderer()
-            ],
-            logger_factory=structlog.stdlib.LoggerFactory(),
-            cache_logger_on_first_use=True,
-        )
+        global _CONFIGURED, _SINK
+
+        with _CONFIGURE_LOCK:
+            if _CONFIGURED:
+                self.log_file_path = _SINK.file_path
+                return
+
+            # Rendered JSON goes straight to the console and the batched file writer, bypassing stdlib logging
+            _SINK = BatchedBytesLogger(self.log_file_path, console=getattr(sys.stdout, "buffer", None))
+
+            structlog.configure(
+                processors=[
+                    structlog.processors.TimeStamper(fmt="iso", utc=True, key="timestamp"),
+                    structlog.processors.add_log_level,
+                    structlog.processors.EventRenamer(to="event"),
+                    _orjson_renderer
+                ],
+                wrapper_class=structlog.make_filtering_bound_logger(logging.INFO),
+                logger_factory=lambda *_: _SINK,
+                cache_logger_on_first_use=True,
+            )
+            _CONFIGURED = True
 
     def get_logger(self, name: str = "EstateRAG"):
         return structlog.get_logger(name)
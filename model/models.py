@@ -1,4 +1,5 @@
-from pydantic import BaseModel, RootModel
+import msgspec
+from pydantic import BaseModel, ConfigDict, RootModel
 from typing import List, Union
 from enum import Enum
 
@@ -6,6 +7,8 @@ class Metadata(BaseModel):
     """
     Structured metadata extracted from estate-related documents.
     """
+    model_config = ConfigDict(frozen=True, validate_assignment=False)
+
     summary: List[str]
     title: str
     author: List[str]
@@ -20,6 +23,8 @@ class ChangeFormat(BaseModel):
     """
     Represents a change detected on a specific page of the document.
     """
+    model_config = ConfigDict(frozen=True, validate_assignment=False)
+
     page: str
     changes: str
 
@@ -27,7 +32,19 @@ class SummaryResponse(RootModel[List[ChangeFormat]]):
     """
     Root model for a list of page-level changes in estate documents.
     """
-    pass
+    model_config = ConfigDict(frozen=True, validate_assignment=False)
+
+class ChangeFormatStruct(msgspec.Struct, frozen=True):
+    """
+    msgspec counterpart of ChangeFormat, decoded and validated in C.
+    LLMs emit page as a number or a string; it is normalized to str to match ChangeFormat.page.
+    """
+    page: Union[int, str]
+    changes: str
+
+    def __post_init__(self):
+        if not isinstance(self.page, str):
+            msgspec.structs.force_setattr(self, "page", str(self.page))
 
 class PromptType(str, Enum):
     """
@@ -1,4 +1,5 @@
-from setuptools import setup,find_packages
+import os
+from setuptools import setup,find_packages,Extension
 from pathlib import Path
 
 def parse_requirements(filename):
@@ -9,6 +10,22 @@ def parse_requirements(filename):
             if line.strip() and not line.startswith("#") and not line.startswith("-e")
         ]
 
+def cython_extensions():
+    """
+    Compiles hot-path modules with Cython when ESTATE_RAG_CYTHON=1 is set (and Cython is installed).
+    Off by default: an editable install would build the .so in place, shadowing later edits to the .py source.
+    """
+    if os.getenv("ESTATE_RAG_CYTHON") != "1":
+        return []
+    try:
+        from Cython.Build import cythonize
+    except ImportError:
+        return []
+    return cythonize(
+        [Extension("core.estate_exception", ["core/estate_exception.py"])],
+        compiler_directives={"language_level": 3},
+    )
+
 setup(
     name="estate-rag-assistant",
     version="0.1",
@@ -18,8 +35,10 @@ setup(
     packages=find_packages(exclude=["tests*", "examples*"]),
     include_package_data=True,
     install_requires=parse_requirements("requirements.txt"),
+    ext_modules=cython_extensions(),
     extras_require={
-        "dev": ["pytest", "pylint", "ipykernel"]
+        "dev": ["pytest", "pylint", "ipykernel"],
+        "cython": ["Cython>=3.0"]
     },
     classifiers=[
         "Programming Language :: Python :: 3.10",
@@ -1,11 +1,9 @@
-import os
-import sys
 from model.models import Metadata
-from utils.model_loader import ModelLoader
+from src.shared.llm_singletons import (
+    get_llm, get_parser, get_fixing_parser, get_format_instructions, get_chain, get_response_cache
+)
 from core.estate_exception import EstateRAGException
 from logger import LOGGER as log
-from langchain_core.output_parsers import JsonOutputParser
-from langchain.output_parsers import OutputFixingParser
 from prompt.prompt_library import PROMPT_REGISTRY 
 
 class EstateDocumentAnalyzer:
@@ -15,38 +13,44 @@ class EstateDocumentAnalyzer:
     """
     def __init__(self):
         try:
-            self.loader = ModelLoader()
-            self.llm = self.loader.load_llm()
+            self.llm = get_llm()
 
             # Estate metadata parser
-            self.parser = JsonOutputParser(pydantic_object=Metadata)
-            self.fixing_parser = OutputFixingParser.from_llm(parser=self.parser, llm=self.llm)
+            self.parser = get_parser(Metadata)
+            self.fixing_parser = get_fixing_parser(Metadata)
 
             # EstateRAG-specific prompt key
             self.prompt = PROMPT_REGISTRY["estate_document_analysis"]
+            self.chain = get_chain("estate_document_analysis", Metadata)
+            self._format_instructions = get_format_instructions(Metadata)
+
+            # Cache of previous analyses, scoped to the current model and prompt
+            self.cache = get_response_cache("estate_document_analysis", Metadata)
 
             log.info("EstateDocumentAnalyzer initialized successfully")
 
         except Exception as e:
             log.error(f"Initialization failed in EstateDocumentAnalyzer: {e}")
-            raise EstateRAGException("Failed to initialize EstateDocumentAnalyzer", sys)
+            raise EstateRAGException("Failed to initialize EstateDocumentAnalyzer", e) from e
 
     def analyze_document(self, document_text: str) -> dict:
         """
         Analyze estate document text and extract structured metadata and summary.
         """
         try:
-            chain = self.prompt | self.llm | self.fixing_parser
-            log.info("Estate metadata analysis chain initialized")
+            log.info("Invoking estate metadata analysis chain")
 
-            response = chain.invoke({
-                "format_instructions": self.parser.get_format_instructions(),
-                "document_text": document_text
-            })
+            response = self.cache.get_or_compute(
+                document_text,
+                lambda: self.chain.invoke({
+                    "format_instructions": self._format_instructions,
+                    "document_text": document_text
+                })
+            )
 
             log.info("Estate metadata extraction successful", extra={"keys": list(response.keys())})
             return response
 
         except Exception as e:
             log.error("Estate metadata analysis failed", extra={"error": str(e)})
-            raise EstateRAGException("Estate metadata extraction failed", sys)
+            raise EstateRAGException("Estate metadata extraction failed", e) from e
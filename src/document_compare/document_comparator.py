@@ -1,10 +1,8 @@
-import sys
-from dotenv import load_dotenv
 import pandas as pd
 from typing import List
-from langchain_core.output_parsers import JsonOutputParser
-from langchain.output_parsers import OutputFixingParser
-from utils.model_loader import ModelLoader
+from src.shared.llm_singletons import (
+    get_llm, get_parser, get_fixing_parser, get_format_instructions, get_chain, get_response_cache
+)
 from logger import LOGGER as log
 from core.estate_exception import EstateRAGException
 from prompt.prompt_library import PROMPT_REGISTRY
@@ -17,15 +15,15 @@ class EstateDocumentComparatorLLM:
     """
     def __init__(self):
         try:
-            load_dotenv()
-            self.loader = ModelLoader()
-            self.llm = self.loader.load_llm()
+            self.llm = get_llm()
 
-            self.parser = JsonOutputParser(pydantic_object=SummaryResponse)
-            self.fixing_parser = OutputFixingParser.from_llm(parser=self.parser, llm=self.llm)
+            self.parser = get_parser(SummaryResponse)
+            self.fixing_parser = get_fixing_parser(SummaryResponse)
 
             self.prompt = PROMPT_REGISTRY[PromptType.ESTATE_DOCUMENT_COMPARISON.value]
-            self.chain = self.prompt | self.llm | self.fixing_parser
+            self.chain = get_chain(PromptType.ESTATE_DOCUMENT_COMPARISON.value, SummaryResponse)
+            self._format_instructions = get_format_instructions(SummaryResponse)
+            self.cache = get_response_cache(PromptType.ESTATE_DOCUMENT_COMPARISON.value, SummaryResponse)
 
             log.info("EstateDocumentComparatorLLM initialized", extra={"model": str(self.llm)})
 
@@ -40,11 +38,11 @@ class EstateDocumentComparatorLLM:
         try:
             inputs = {
                 "combined_docs": combined_docs,
-                "format_instruction": self.parser.get_format_instructions()
+                "format_instruction": self._format_instructions
             }
 
             log.info("Invoking estate document comparison chain")
-            response = self.chain.invoke(inputs)
+            response = self.cache.get_or_compute(combined_docs, lambda: self.chain.invoke(inputs))
 
             log.info("Comparison chain invoked successfully", extra={
                 "response_preview": str(response)[:200]
@@ -61,7 +59,7 @@ class EstateDocumentComparatorLLM:
         Converts parsed response into a pandas DataFrame.
         """
         try:
-            df = pd.DataFrame(response_parsed)
+            df = pd.DataFrame.from_records(response_parsed, columns=["page", "changes"])
             return df
         except Exception as e:
             log.error("Error formatting comparison response", extra={"error": str(e)})
@@ -1,21 +1,205 @@
 import os
-from typing import Optional
+import sys
+import mmap
+import threading
+import multiprocessing
+from typing import Iterator, List, Optional, Tuple
 import shutil
+from contextlib import contextmanager
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from pathlib import Path
 import fitz
+from src.document_ingestion.pdf_text import extract_page_slice, page_text
 from utils.file_io import generate_session_id
 from core.estate_exception import EstateRAGException
 from logger import LOGGER as log
 
 
+# Opt-in number of worker processes for page extraction; unset or below 2 keeps extraction serial
+PDF_WORKERS_ENV = "ESTATE_PDF_WORKERS"
+
+# Below this page count, shipping pages to worker processes costs more than it saves
+PARALLEL_PAGE_THRESHOLD = 256
+
+# Shared page-extraction pool, created on first parallel read
+_PAGE_POOL: Optional[ProcessPoolExecutor] = None
+_PAGE_POOL_LOCK = threading.Lock()
+
+# Buffer size for streaming uploaded files to disk
+COPY_CHUNK_SIZE = 1 << 20
+
+# sendfile() into a regular file is Linux-only; macOS and the BSDs require a socket destination
+SENDFILE_TO_FILES = sys.platform.startswith("linux") and hasattr(os, "sendfile")
+
+# Header placed before each page's text, formatted with (page_number, text)
+PAGE_TEMPLATE = "\n--- Page %d ---\n%s"
+
+# PDFs smaller than this are opened by path; the mmap setup costs more than it saves
+MMAP_MIN_BYTES = 1 << 20
+
+# Upper bound on threads used to delete old sessions concurrently
+MAX_CLEANUP_WORKERS = 8
+
+# PyMuPDF extraction modes: plain text, or text blocks kept in MuPDF's block segmentation
+EXTRACT_MODES = ("text", "blocks")
+
+
+@contextmanager
+def _open_pdf(pdf_path) -> Iterator[fitz.Document]:
+    """
+    Opens a PDF for reading. Files of MMAP_MIN_BYTES or more are memory-mapped and parsed
+    from the page cache, avoiding a second copy of the file in a Python bytes object.
+    """
+    if os.path.getsize(pdf_path) < MMAP_MIN_BYTES:
+        with fitz.open(pdf_path) as doc:
+            yield doc
+        return
+
+    with open(pdf_path, "rb") as fh, mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        view = memoryview(mm)
+        try:
+            try:
+                doc = fitz.open(stream=view, filetype="pdf")
+            except TypeError:
+                # PyMuPDF build without memoryview stream support: let MuPDF read the file itself
+                doc = fitz.open(pdf_path)
+            with doc:
+                yield doc
+        finally:
+            # Release the export so the mapping can close
+            view.release()
+
+
+def _available_cpus() -> int:
+    """
+    Returns the number of CPUs this process may run on, honouring affinity masks (taskset, cpusets).
+    """
+    if hasattr(os, "sched_getaffinity"):
+        return len(os.sched_getaffinity(0))
+    return os.cpu_count() or 1
+
+
+def _pdf_workers() -> int:
+    """
+    Returns the number of page-extraction processes requested via PDF_WORKERS_ENV, capped at the usable CPUs.
+    """
+    try:
+        requested = int(os.getenv(PDF_WORKERS_ENV, "0"))
+    except ValueError:
+        log.warning("Ignoring invalid worker count", extra={"env": PDF_WORKERS_ENV})
+        return 0
+    return min(requested, _available_cpus())
+
+
+def _page_pool(workers: int) -> ProcessPoolExecutor:
+    """
+    Returns the process-wide page-extraction pool, creating it on first use.
+    Workers are started with forkserver (spawn where unavailable), never fork: this process
+    runs the log writer thread, which a forked child would inherit mid-operation.
+    """
+    global _PAGE_POOL
+    with _PAGE_POOL_LOCK:
+        if _PAGE_POOL is None:
+            method = "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+            context = multiprocessing.get_context(method)
+            if method == "forkserver":
+                context.set_forkserver_preload([extract_page_slice.__module__])
+            _PAGE_POOL = ProcessPoolExecutor(max_workers=workers, mp_context=context)
+        return _PAGE_POOL
+
+
+def _iter_page_texts(pdf_path, doc, mode: str = "text") -> Iterator[str]:
+    """
+    Yields the text of every page in an open PDF, in page order.
+    When PDF_WORKERS_ENV enables it, large documents are split into contiguous page slices
+    extracted in a shared pool of worker processes.
+    """
+    page_count = doc.page_count
+    workers = min(_pdf_workers(), page_count)
+
+    if page_count < PARALLEL_PAGE_THRESHOLD or workers < 2:
+        for page_num in range(page_count):
+            yield page_text(doc.load_page(page_num), mode)
+        return
+
+    pool = _page_pool(workers)
+    slice_size = -(-page_count // workers)
+    futures = [
+        pool.submit(extract_page_slice, str(pdf_path), start, min(start + slice_size, page_count), mode)
+        for start in range(0, page_count, slice_size)
+    ]
+    try:
+        for future in futures:
+            yield from future.result()
+    finally:
+        for future in futures:
+            future.cancel()
+
+
+def _upload_fd(uploaded_file) -> Optional[int]:
+    """
+    Returns the OS file descriptor backing an upload, or None when it has none.
+    """
+    if not getattr(uploaded_file, "_rolled", True):
+        # In-memory SpooledTemporaryFile: fileno() would first write the whole upload to disk
+        return None
+    try:
+        return uploaded_file.fileno()
+    except (AttributeError, OSError, ValueError):
+        return None
+
+
+def _copy_upload(uploaded_file, dest) -> None:
+    """
+    Streams an uploaded file into an open binary destination without holding it in memory.
+    On Linux, uses sendfile() when the upload is backed by a real file descriptor.
+    """
+    if not hasattr(uploaded_file, "read"):
+        dest.write(uploaded_file.getbuffer())
+        return
+
+    src_fd = _upload_fd(uploaded_file) if SENDFILE_TO_FILES else None
+    if src_fd is not None:
+        offset = uploaded_file.tell()
+        dest.flush()
+        try:
+            remaining = os.fstat(src_fd).st_size - offset
+            while remaining > 0:
+                sent = os.sendfile(dest.fileno(), src_fd, offset, remaining)
+                if sent == 0:
+                    break
+                offset += sent
+                remaining -= sent
+            return
+        except OSError as e:
+            # Not supported for this pair of files; finish with a buffered copy from where sendfile stopped
+            log.debug("sendfile unavailable, copying upload", extra={"error": str(e)})
+            uploaded_file.seek(offset)
+
+    shutil.copyfileobj(uploaded_file, dest, length=COPY_CHUNK_SIZE)
+
+
+def _remove_session(folder: Path) -> Path:
+    """
+    Deletes a session directory tree, ignoring errors, and returns its path.
+    """
+    shutil.rmtree(folder, ignore_errors=True)
+    return folder
+
+
 class EstateDocHandler:
     """
     EstateRAG: Handles saving and reading estate-related PDFs for analysis.
     Organizes files by session and ensures valid input format.
     """
+    __slots__ = ("data_dir", "session_id", "session_path", "extract_mode")
 
-    def __init__(self, data_dir: Optional[str] = None, session_id: Optional[str] = None):
+    def __init__(self, data_dir: Optional[str] = None, session_id: Optional[str] = None, extract_mode: str = "text"):
         try:
+            if extract_mode not in EXTRACT_MODES:
+                raise ValueError(f"Unsupported extract mode: {extract_mode}")
+            self.extract_mode = extract_mode
+
             self.data_dir = data_dir or os.getenv(
                 "ESTATE_DATA_STORAGE_PATH",
                 os.path.join(os.getcwd(), "data", "document_analysis")
@@ -44,10 +228,7 @@ class EstateDocHandler:
 
             save_path = os.path.join(self.session_path, filename)
             with open(save_path, "wb") as f:
-                if hasattr(uploaded_file, "read"):
-                    f.write(uploaded_file.read())
-                else:
-                    f.write(uploaded_file.getbuffer())
+                _copy_upload(uploaded_file, f)
 
             log.info("Estate PDF saved successfully", extra={
                 "file": filename,
@@ -64,20 +245,30 @@ class EstateDocHandler:
             })
             raise EstateRAGException(f"Failed to save estate PDF: {str(e)}", e) from e
 
+    def iter_pages(self, pdf_path: str) -> Iterator[Tuple[int, str]]:
+        """
+        Yields (page_number, text) for each page of an estate-related PDF, one page at a time.
+        """
+        try:
+            with _open_pdf(pdf_path) as doc:
+                for page_num, text in enumerate(_iter_page_texts(pdf_path, doc, self.extract_mode), start=1):
+                    yield page_num, text
+
+        except Exception as e:
+            log.error("Failed to iterate estate PDF pages", extra={
+                "error": str(e),
+                "pdf_path": pdf_path,
+                "session_id": self.session_id
+            })
+            raise EstateRAGException(f"Could not iterate estate PDF pages: {pdf_path}", e) from e
+
     def read_pdf(self, pdf_path: str) -> str:
         """
         Reads an estate-related PDF file and extracts text content page by page.
         Returns the full text as a single string with page markers.
         """
         try:
-            text_chunks = []
-
-            with fitz.open(pdf_path) as doc:
-                for page_num in range(doc.page_count):
-                    page = doc.load_page(page_num)
-                    page_text = page.get_text()
-                    text_chunks.append(f"\n--- Page {page_num + 1} ---\n{page_text}")
-
+            text_chunks = [PAGE_TEMPLATE % page for page in self.iter_pages(pdf_path)]
             full_text = "\n".join(text_chunks)
 
             log.info("Estate PDF read successfully", extra={
@@ -103,9 +294,19 @@ class EstateDocumentIngestion:
     EstateRAG: Handles saving, reading, and combining estate-related PDFs for comparison.
     Organizes documents by session with versioning and cleanup support.
     """
-
-    def __init__(self, base_dir: str = "data/document_compare", session_id: Optional[str] = None):
+    __slots__ = ("base_dir", "session_id", "session_path", "extract_mode")
+
+    def __init__(
+        self,
+        base_dir: str = "data/document_compare",
+        session_id: Optional[str] = None,
+        extract_mode: str = "text"
+    ):
         try:
+            if extract_mode not in EXTRACT_MODES:
+                raise ValueError(f"Unsupported extract mode: {extract_mode}")
+            self.extract_mode = extract_mode
+
             self.base_dir = Path(base_dir)
             self.session_id = session_id or generate_session_id("estate_compare")
             self.session_path = self.base_dir / self.session_id
@@ -132,10 +333,7 @@ class EstateDocumentIngestion:
                 if not fobj.name.lower().endswith(".pdf"):
                     raise ValueError("Only PDF files are allowed.")
                 with open(out_path, "wb") as f:
-                    if hasattr(fobj, "read"):
-                        f.write(fobj.read())
-                    else:
-                        f.write(fobj.getbuffer())
+                    _copy_upload(fobj, f)
 
             log.info("Estate PDFs saved", extra={
                 "reference": str(ref_path),
@@ -152,21 +350,32 @@ class EstateDocumentIngestion:
             })
             raise EstateRAGException("Error saving estate documents", e) from e
 
-    def read_pdf(self, pdf_path: Path) -> str:
+    def iter_pages(self, pdf_path: Path) -> Iterator[Tuple[int, str]]:
         """
-        Reads an estate PDF and extracts page-wise text.
+        Yields (page_number, text) for each non-blank page of an estate PDF, one page at a time.
         """
         try:
-            with fitz.open(pdf_path) as doc:
+            with _open_pdf(pdf_path) as doc:
                 if doc.is_encrypted:
                     raise ValueError(f"PDF is encrypted: {pdf_path.name}")
 
-                parts = []
-                for page_num in range(doc.page_count):
-                    page = doc.load_page(page_num)
-                    text = page.get_text()
+                for page_num, text in enumerate(_iter_page_texts(pdf_path, doc, self.extract_mode), start=1):
                     if text.strip():
-                        parts.append(f"\n--- Page {page_num + 1} ---\n{text}")
+                        yield page_num, text
+
+        except Exception as e:
+            log.error("Error iterating estate PDF pages", extra={
+                "file": str(pdf_path),
+                "error": str(e)
+            })
+            raise EstateRAGException("Error iterating estate PDF pages", e) from e
+
+    def read_pdf(self, pdf_path: Path) -> str:
+        """
+        Reads an estate PDF and extracts page-wise text.
+        """
+        try:
+            parts = [PAGE_TEMPLATE % page for page in self.iter_pages(pdf_path)]
 
             log.info("Estate PDF read successfully", extra={
                 "file": str(pdf_path),
@@ -182,22 +391,41 @@ class EstateDocumentIngestion:
             })
             raise EstateRAGException("Error reading estate PDF", e) from e
 
+    def _session_pdfs(self) -> List[Path]:
+        """
+        Lists the estate PDFs in the session directory, sorted by name.
+        """
+        with os.scandir(self.session_path) as it:
+            entries = sorted(
+                (e for e in it if e.is_file(follow_symlinks=False) and e.name.lower().endswith(".pdf")),
+                key=lambda e: e.name
+            )
+        return [Path(e.path) for e in entries]
+
+    def _iter_combined_text(self, pdf_files: List[Path]) -> Iterator[str]:
+        """
+        Yields the combined text of the given PDFs piece by piece, one page at a time.
+        """
+        for doc_index, file in enumerate(pdf_files):
+            if doc_index:
+                yield "\n\n"
+            yield f"Document: {file.name}\n"
+
+            for page_index, page in enumerate(self.iter_pages(file)):
+                if page_index:
+                    yield "\n"
+                yield PAGE_TEMPLATE % page
+
     def combine_documents(self) -> str:
         """
         Combines all estate PDFs in the session into a single text block.
         """
         try:
-            doc_parts = []
-
-            for file in sorted(self.session_path.iterdir()):
-                if file.is_file() and file.suffix.lower() == ".pdf":
-                    content = self.read_pdf(file)
-                    doc_parts.append(f"Document: {file.name}\n{content}")
-
-            combined_text = "\n\n".join(doc_parts)
+            pdf_files = self._session_pdfs()
+            combined_text = "".join(self._iter_combined_text(pdf_files))
 
             log.info("Estate documents combined", extra={
-                "count": len(doc_parts),
+                "count": len(pdf_files),
                 "session_id": self.session_id
             })
 
@@ -215,10 +443,16 @@ class EstateDocumentIngestion:
         Deletes older estate document sessions, keeping only the latest N.
         """
         try:
-            sessions = sorted([f for f in self.base_dir.iterdir() if f.is_dir()], reverse=True)
-            for folder in sessions[keep_latest:]:
-                shutil.rmtree(folder, ignore_errors=True)
-                log.info("Old estate session deleted", extra={"path": str(folder)})
+            with os.scandir(self.base_dir) as it:
+                sessions = sorted((Path(e.path) for e in it if e.is_dir()), reverse=True)
+            stale = sessions[keep_latest:]
+            if not stale:
+                return
+
+            # Directory removal is syscall-latency bound, so overlap it across threads
+            with ThreadPoolExecutor(max_workers=min(MAX_CLEANUP_WORKERS, len(stale))) as pool:
+                for folder in pool.map(_remove_session, stale):
+                    log.info("Old estate session deleted", extra={"path": str(folder)})
 
         except Exception as e:
             log.error("Error cleaning old estate sessions", extra={"error": str(e)})
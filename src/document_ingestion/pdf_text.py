@@ -0,0 +1,26 @@
+from typing import List
+import fitz
+
+# Kept free of logger/config imports: worker processes import this module to run
+# `extract_page_slice`, and should not pay for (or set up) the application's logging.
+
+
+def page_text(page, mode: str) -> str:
+    """
+    Extracts a page's text in the given mode, skipping PyMuPDF's reading-order sort.
+    In "blocks" mode each text block is kept intact and blocks are separated by a blank line.
+    """
+    if mode == "blocks":
+        return "\n".join(block[4] for block in page.get_text("blocks", sort=False) if block[6] == 0)
+    return page.get_text("text", sort=False)
+
+
+def extract_page_slice(pdf_path: str, start: int, end: int, mode: str = "text") -> List[str]:
+    """
+    Extracts raw text for pages [start, end) of a PDF. Runs inside a worker process.
+    """
+    texts = [None] * (end - start)
+    with fitz.open(pdf_path) as doc:
+        for i in range(end - start):
+            texts[i] = page_text(doc.load_page(start + i), mode)
+    return texts
@@ -0,0 +1,103 @@
+import functools
+import hashlib
+from typing import List
+from langchain_core.output_parsers import BaseOutputParser, JsonOutputParser
+from langchain.output_parsers import OutputFixingParser
+from utils.model_loader import ModelLoader
+from utils.response_cache import LLMResponseCache
+from prompt.prompt_library import PROMPT_REGISTRY
+from model.models import ChangeFormatStruct, SummaryResponse
+from src.shared.output_parsers import MsgspecJsonOutputParser
+from logger import LOGGER as log
+
+
+# Schemas whose LLM output is decoded with msgspec instead of the generic JSON parser
+MSGSPEC_DECODE_TYPES = {
+    SummaryResponse: List[ChangeFormatStruct],
+}
+
+
+def get_model_loader() -> ModelLoader:
+    """
+    Returns the process-wide ModelLoader.
+    """
+    return ModelLoader.instance()
+
+
+def get_llm():
+    """
+    Returns the process-wide LLM client, so all components reuse one warm HTTP connection pool.
+    """
+    return get_model_loader().llm
+
+
+@functools.lru_cache(maxsize=4)
+def get_parser(pydantic_object) -> BaseOutputParser:
+    """
+    Returns the shared JSON output parser for a pydantic schema.
+    """
+    if pydantic_object in MSGSPEC_DECODE_TYPES:
+        return MsgspecJsonOutputParser(
+            decode_type=MSGSPEC_DECODE_TYPES[pydantic_object],
+            pydantic_object=pydantic_object
+        )
+    return JsonOutputParser(pydantic_object=pydantic_object)
+
+
+@functools.lru_cache(maxsize=4)
+def get_fixing_parser(pydantic_object) -> OutputFixingParser:
+    """
+    Returns the shared LLM-backed fixing parser wrapping `get_parser(pydantic_object)`.
+    """
+    return OutputFixingParser.from_llm(parser=get_parser(pydantic_object), llm=get_llm())
+
+
+@functools.cache
+def get_format_instructions(pydantic_object) -> str:
+    """
+    Returns the format instructions for a schema; constant per schema, so rendered once.
+    """
+    return get_parser(pydantic_object).get_format_instructions()
+
+
+@functools.lru_cache(maxsize=4)
+def get_chain(prompt_key: str, pydantic_object):
+    """
+    Returns the shared `prompt | llm | fixing_parser` runnable for a registered prompt and schema.
+    """
+    return PROMPT_REGISTRY[prompt_key] | get_llm() | get_fixing_parser(pydantic_object)
+
+
+def _cache_fingerprint(prompt_key: str, pydantic_object) -> str:
+    """
+    Hashes everything besides the input that determines a chain's answer:
+    the configured model, the prompt template and the schema's format instructions.
+    """
+    digest = hashlib.sha256()
+    for part in (
+        get_model_loader().llm_id,
+        PROMPT_REGISTRY[prompt_key].pretty_repr(),
+        get_format_instructions(pydantic_object),
+    ):
+        digest.update(part.encode("utf-8"))
+        digest.update(b"\0")
+    return digest.hexdigest()[:16]
+
+
+@functools.lru_cache(maxsize=4)
+def get_response_cache(prompt_key: str, pydantic_object) -> LLMResponseCache:
+    """
+    Returns the shared LLM response cache for a registered prompt and schema.
+    Entries are scoped to the model, prompt and format instructions in use, so changing any of them
+    never serves answers produced by the old setup.
+    """
+    try:
+        fingerprint = _cache_fingerprint(prompt_key, pydantic_object)
+    except Exception as e:
+        # Unscoped entries could outlive a model or prompt change, so run uncached instead
+        log.warning("LLM response cache fingerprint failed, caching disabled", extra={
+            "namespace": prompt_key,
+            "error": str(e)
+        })
+        return LLMResponseCache(prompt_key, db_path="", enabled=False)
+    return LLMResponseCache.from_config(prompt_key, get_model_loader(), fingerprint=fingerprint)
@@ -0,0 +1,40 @@
+import re
+from typing import Any
+import msgspec
+from langchain_core.exceptions import OutputParserException
+from langchain_core.output_parsers import BaseOutputParser, JsonOutputParser
+from langchain_core.utils.json import parse_json_markdown
+
+# LLMs often wrap JSON in a ```json ... ``` fence
+_JSON_FENCE = re.compile(r"```(?:json)?\s*(.*?)\s*```", re.DOTALL)
+
+
+class MsgspecJsonOutputParser(BaseOutputParser[Any]):
+    """
+    Decodes and validates LLM JSON output against a msgspec type in a single C pass.
+    Returns plain lists/dicts; format instructions are still rendered from the pydantic schema.
+    """
+    decode_type: Any
+    pydantic_object: Any
+
+    def parse(self, text: str) -> Any:
+        match = _JSON_FENCE.search(text)
+        raw = match.group(1) if match else text.strip()
+        try:
+            return msgspec.to_builtins(msgspec.json.decode(raw, type=self.decode_type))
+        except msgspec.DecodeError:
+            pass
+
+        # Lenient path matching JsonOutputParser (e.g. raw newlines inside strings), so such output
+        # doesn't cost an OutputFixingParser LLM round-trip
+        try:
+            return msgspec.to_builtins(msgspec.convert(parse_json_markdown(text), type=self.decode_type))
+        except (ValueError, msgspec.ValidationError) as e:
+            raise OutputParserException(f"Invalid JSON output: {e}", llm_output=text) from e
+
+    def get_format_instructions(self) -> str:
+        return JsonOutputParser(pydantic_object=self.pydantic_object).get_format_instructions()
+
+    @property
+    def _type(self) -> str:
+        return "msgspec_json"
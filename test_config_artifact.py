@@ -0,0 +1,126 @@
+import os
+import shutil
+import stat
+import tempfile
+from utils import config_loader
+from utils.config_loader import load_config
+
+CONFIG_TEMPLATE = """
+embedding_model:
+  model_name: "models/text-embedding-004"
+
+llm:
+  google:
+    provider: "google"
+    model_name: "gemini-2.0-flash"
+
+retriever:
+  top_k: {top_k}
+"""
+
+
+def _write_yaml(directory, top_k):
+    path = os.path.join(directory, "config.yaml")
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(CONFIG_TEMPLATE.format(top_k=top_k))
+    return path
+
+
+def _load(path):
+    load_config.cache_clear()
+    return load_config(path)
+
+
+def test_artifact_follows_yaml_edits():
+    with tempfile.TemporaryDirectory() as tmp:
+        yaml_path = _write_yaml(tmp, 10)
+        artifact_path = config_loader._binary_config_path(yaml_path)
+
+        assert _load(yaml_path).retriever.top_k == 10
+        assert os.path.exists(artifact_path), "first load should write the artifact"
+
+        # Same size, and an artifact mtime ahead of the YAML: only the content digest can tell them apart
+        _write_yaml(tmp, 20)
+        future = os.stat(yaml_path).st_mtime_ns + 10 ** 9
+        os.utime(artifact_path, ns=(future, future))
+
+        assert _load(yaml_path).retriever.top_k == 20, "stale artifact must not be served"
+        print("✅ Artifact is rebuilt after a YAML edit")
+
+
+def test_corrupt_artifact_is_ignored():
+    with tempfile.TemporaryDirectory() as tmp:
+        yaml_path = _write_yaml(tmp, 10)
+        artifact_path = config_loader._binary_config_path(yaml_path)
+
+        # Truncated MessagePack, then a foreign (e.g. pickle-like) payload
+        for payload in (b"\x85\xa7version", b"\x80\x04\x95cos\nsystem\n"):
+            with open(artifact_path, "wb") as f:
+                f.write(payload)
+            assert _load(yaml_path).retriever.top_k == 10, "corrupt artifact should fall back to the YAML"
+
+        with open(artifact_path, "rb") as f:
+            assert f.read(1) != b"\x80", "corrupt artifact should be rewritten"
+        print("✅ Corrupt artifacts fall back to the YAML and are rewritten")
+
+
+def test_read_only_directory_serves_yaml():
+    with tempfile.TemporaryDirectory() as tmp:
+        config_dir = os.path.join(tmp, "config")
+        os.makedirs(config_dir)
+        yaml_path = _write_yaml(config_dir, 10)
+        os.chmod(config_dir, stat.S_IRUSR | stat.S_IXUSR)
+        try:
+            # root ignores directory permissions; simulate the failing write instead
+            original_mkstemp = config_loader.tempfile.mkstemp
+            if os.access(config_dir, os.W_OK):
+                def _read_only(*args, **kwargs):
+                    raise PermissionError("read-only config directory")
+                config_loader.tempfile.mkstemp = _read_only
+            try:
+                assert _load(yaml_path).retriever.top_k == 10
+            finally:
+                config_loader.tempfile.mkstemp = original_mkstemp
+
+            assert not os.path.exists(config_loader._binary_config_path(yaml_path))
+        finally:
+            os.chmod(config_dir, stat.S_IRWXU)
+            shutil.rmtree(config_dir, ignore_errors=True)
+        print("✅ Read-only config directory serves the parsed YAML")
+
+
+def test_artifact_is_world_readable():
+    with tempfile.TemporaryDirectory() as tmp:
+        yaml_path = _write_yaml(tmp, 10)
+        artifact_path = config_loader.compile_config(yaml_path)
+
+        # The artifact is built in CI/image builds and read by the app, often as a different user
+        mode = stat.S_IMODE(os.stat(artifact_path).st_mode)
+        assert mode == 0o644, f"expected artifact mode 644, got {mode:o}"
+        print("✅ Compiled artifact is readable by other users")
+
+
+def test_failed_artifact_write_serves_yaml():
+    with tempfile.TemporaryDirectory() as tmp:
+        yaml_path = _write_yaml(tmp, 10)
+
+        # Any write failure, not just OSError, must fall back to the parsed YAML and leave no temp file
+        original_replace = config_loader.os.replace
+        def _broken_replace(*args, **kwargs):
+            raise RuntimeError("unsupported filesystem")
+        config_loader.os.replace = _broken_replace
+        try:
+            assert _load(yaml_path).retriever.top_k == 10
+        finally:
+            config_loader.os.replace = original_replace
+
+        assert os.listdir(tmp) == ["config.yaml"], f"leftover files: {os.listdir(tmp)}"
+        print("✅ Failed artifact write serves the parsed YAML")
+
+
+if __name__ == "__main__":
+    test_artifact_follows_yaml_edits()
+    test_corrupt_artifact_is_ignored()
+    test_read_only_directory_serves_yaml()
+    test_artifact_is_world_readable()
+    test_failed_artifact_write_serves_yaml()
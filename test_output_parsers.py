@@ -0,0 +1,40 @@
+from typing import List
+from langchain_core.exceptions import OutputParserException
+from model.models import ChangeFormatStruct, SummaryResponse
+from src.shared.output_parsers import MsgspecJsonOutputParser
+
+
+def _parser():
+    return MsgspecJsonOutputParser(decode_type=List[ChangeFormatStruct], pydantic_object=SummaryResponse)
+
+
+def test_fenced_payload():
+    text = '```json\n[{"page": 1, "changes": "Rent raised to 1200"}]\n```'
+
+    assert _parser().parse(text) == [{"page": "1", "changes": "Rent raised to 1200"}]
+    print("✅ Fenced payload is decoded")
+
+
+def test_raw_newline_payload():
+    # Rejected by strict JSON, accepted by JsonOutputParser; must not fall through to OutputFixingParser
+    text = '[{"page": 1, "changes": "line1\nline2"}]'
+
+    assert _parser().parse(text) == [{"page": "1", "changes": "line1\nline2"}]
+    print("✅ Raw newlines inside strings are accepted")
+
+
+def test_missing_field_payload():
+    text = '[{"page": 1}]'
+
+    try:
+        _parser().parse(text)
+    except OutputParserException:
+        print("✅ Missing field raises OutputParserException")
+    else:
+        raise AssertionError("a payload without 'changes' must be rejected")
+
+
+if __name__ == "__main__":
+    test_fenced_payload()
+    test_raw_newline_payload()
+    test_missing_field_payload()
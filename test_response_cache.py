@@ -0,0 +1,77 @@
+import os
+import tempfile
+from utils.response_cache import LLMResponseCache
+
+
+class CountingChain:
+    """
+    Stand-in for an LLM chain that records how often it was invoked.
+    """
+    def __init__(self):
+        self.calls = 0
+
+    def __call__(self, text):
+        self.calls += 1
+        return {"summary": text.upper(), "calls": self.calls}
+
+
+def test_exact_hit_and_miss():
+    with tempfile.TemporaryDirectory() as tmp:
+        cache = LLMResponseCache("test_namespace", db_path=os.path.join(tmp, "cache.sqlite3"))
+        chain = CountingChain()
+
+        first = cache.get_or_compute("Rent 1000", lambda: chain("Rent 1000"))
+        again = cache.get_or_compute("Rent 1000", lambda: chain("Rent 1000"))
+        other = cache.get_or_compute("Rent 2000", lambda: chain("Rent 2000"))
+
+        assert first == again, "exact hit should return the stored response"
+        assert other["summary"] == "RENT 2000", "a different input must not reuse another answer"
+        assert chain.calls == 2, f"expected 2 LLM calls, got {chain.calls}"
+        print("✅ Exact hit and miss behave as expected")
+
+
+def test_namespaces_are_isolated():
+    with tempfile.TemporaryDirectory() as tmp:
+        db_path = os.path.join(tmp, "cache.sqlite3")
+        chain = CountingChain()
+
+        LLMResponseCache("analysis:model-a", db_path=db_path).get_or_compute("Rent 1000", lambda: chain("Rent 1000"))
+        LLMResponseCache("analysis:model-b", db_path=db_path).get_or_compute("Rent 1000", lambda: chain("Rent 1000"))
+
+        assert chain.calls == 2, "a different model/prompt fingerprint must not share entries"
+        print("✅ Namespaces do not share entries")
+
+
+def test_disabled_cache_always_computes():
+    with tempfile.TemporaryDirectory() as tmp:
+        db_path = os.path.join(tmp, "cache.sqlite3")
+        cache = LLMResponseCache("test_namespace", db_path=db_path, enabled=False)
+        chain = CountingChain()
+
+        cache.get_or_compute("Rent 1000", lambda: chain("Rent 1000"))
+        cache.get_or_compute("Rent 1000", lambda: chain("Rent 1000"))
+
+        assert chain.calls == 2, "disabled cache must invoke the chain every time"
+        assert not os.path.exists(db_path), "disabled cache must not create a database"
+        print("✅ Disabled cache always invokes the chain")
+
+
+def test_unusable_db_path_disables_cache():
+    with tempfile.TemporaryDirectory() as tmp:
+        # A regular file where the cache directory should be makes setup fail
+        blocker = os.path.join(tmp, "not_a_dir")
+        open(blocker, "w").close()
+
+        cache = LLMResponseCache("test_namespace", db_path=os.path.join(blocker, "cache.sqlite3"))
+        chain = CountingChain()
+
+        assert not cache.enabled, "setup failure should disable the cache"
+        assert cache.get_or_compute("Rent 1000", lambda: chain("Rent 1000"))["calls"] == 1
+        print("✅ Setup failure falls through to the chain")
+
+
+if __name__ == "__main__":
+    test_exact_hit_and_miss()
+    test_namespaces_are_isolated()
+    test_disabled_cache_always_computes()
+    test_unusable_db_path_disables_cache()
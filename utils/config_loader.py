@@ -1,6 +1,115 @@
 from pathlib import Path
+from functools import lru_cache
+from contextlib import suppress
+from dataclasses import dataclass, field
+from types import MappingProxyType
+from typing import Any, Mapping, Optional
+import argparse
+import hashlib
 import os
+import tempfile
+import msgspec
 import yaml
+from utils.environment import getenv
+
+# Prefer the libyaml C parser; fall back to the pure-Python loader when PyYAML was built without it
+try:
+    from yaml import CSafeLoader as _Loader
+except ImportError:
+    from yaml import SafeLoader as _Loader
+
+
+# Resolved once at import; this file lives at <project_root>/utils/config_loader.py
+PROJECT_ROOT: Path = Path(__file__).resolve().parents[1]
+DEFAULT_CONFIG_PATH: Path = PROJECT_ROOT / "config" / "config.yaml"
+
+# Plain-string forms for the per-call resolution path, which sticks to os.path
+_PROJECT_ROOT_STR = str(PROJECT_ROOT)
+_DEFAULT_CONFIG_PATH_STR = str(DEFAULT_CONFIG_PATH)
+
+# Bumped whenever the layout of the precompiled config artifact changes
+_ARTIFACT_VERSION = 2
+
+
+def _build_section(cls, name: str, raw: Any):
+    """
+    Instantiates a config section dataclass, turning missing or unknown keys into a clear error.
+    """
+    if raw is None:
+        raw = {}
+    if not isinstance(raw, Mapping):
+        raise ValueError(f"Config section '{name}' must be a mapping, got {type(raw).__name__}")
+    try:
+        return cls(**raw)
+    except TypeError as e:
+        raise ValueError(f"Invalid config section '{name}': {e}") from e
+
+
+@dataclass(slots=True, frozen=True)
+class LLMProviderCfg:
+    provider: str
+    model_name: str
+    temperature: float = 0.2
+    max_output_tokens: int = 2048
+
+
+@dataclass(slots=True, frozen=True)
+class EmbeddingModelCfg:
+    model_name: str
+    provider: str = "google"
+
+
+@dataclass(slots=True, frozen=True)
+class FaissDbCfg:
+    collection_name: str
+
+
+@dataclass(slots=True, frozen=True)
+class RetrieverCfg:
+    top_k: int = 10
+
+
+@dataclass(slots=True, frozen=True)
+class ResponseCacheCfg:
+    enabled: bool = True
+    db_path: str = os.path.join("data", "cache", "llm_responses.sqlite3")
+    semantic: bool = False
+    similarity_threshold: float = 0.95
+
+
+@dataclass(slots=True, frozen=True)
+class AppConfig:
+    """
+    Validated, immutable view of config.yaml; sections are read via attribute access.
+    """
+    embedding_model: EmbeddingModelCfg
+    llm: Mapping[str, LLMProviderCfg] = field(hash=False)
+    faiss_db: Optional[FaissDbCfg] = None
+    retriever: RetrieverCfg = field(default_factory=RetrieverCfg)
+    response_cache: ResponseCacheCfg = field(default_factory=ResponseCacheCfg)
+
+    @classmethod
+    def from_dict(cls, raw: Mapping[str, Any]) -> "AppConfig":
+        """
+        Builds the config from the parsed YAML, raising ValueError on missing, unknown or malformed keys.
+        """
+        unknown = raw.keys() - cls.__dataclass_fields__.keys()
+        if unknown:
+            raise ValueError(f"Unknown config sections: {sorted(unknown)}")
+
+        llm_block = raw.get("llm")
+        if not isinstance(llm_block, Mapping) or not llm_block:
+            raise ValueError("Config section 'llm' must map provider keys to model settings")
+
+        return cls(
+            embedding_model=_build_section(EmbeddingModelCfg, "embedding_model", raw.get("embedding_model")),
+            llm=MappingProxyType({
+                key: _build_section(LLMProviderCfg, f"llm.{key}", value) for key, value in llm_block.items()
+            }),
+            faiss_db=_build_section(FaissDbCfg, "faiss_db", raw["faiss_db"]) if raw.get("faiss_db") is not None else None,
+            retriever=_build_section(RetrieverCfg, "retriever", raw.get("retriever")),
+            response_cache=_build_section(ResponseCacheCfg, "response_cache", raw.get("response_cache")),
+        )
 
 
 def get_project_root() -> Path:
@@ -9,35 +118,185 @@ def get_project_root() -> Path:
     Assumes this file is located at .../utils/config_loader.py,
     so the project root is two levels up.
     """
-    return Path(__file__).resolve().parents[1]
+    return PROJECT_ROOT
 
 
-def load_config(config_path: str | None = None) -> dict:
+def _resolve_config_path(config_path: str | None = None) -> str:
     """
-    Loads a YAML configuration file with reliable path resolution,
-    regardless of the current working directory.
+    Resolves the configuration file path.
 
     Priority:
     1. Explicit argument
     2. CONFIG_PATH environment variable
     3. <project_root>/config/config.yaml
     """
-    env_path = os.getenv("CONFIG_PATH")
-
     if config_path is None:
-        config_path = env_path or str(get_project_root() / "config" / "config.yaml")
+        config_path = getenv("CONFIG_PATH") or _DEFAULT_CONFIG_PATH_STR
+    else:
+        config_path = os.fspath(config_path)
+
+    if not os.path.isabs(config_path):
+        config_path = os.path.join(_PROJECT_ROOT_STR, config_path)
+
+    if not os.path.exists(config_path):
+        raise FileNotFoundError(f"Config file not found: {config_path}")
+
+    return config_path
+
+
+class _ConfigArtifact(msgspec.Struct):
+    """
+    Envelope of the precompiled config: MessagePack data only, so decoding can never run code.
+    """
+    version: int
+    source_digest: str
+    config: dict
+
+
+_ARTIFACT_ENCODER = msgspec.msgpack.Encoder()
+_ARTIFACT_DECODER = msgspec.msgpack.Decoder(_ConfigArtifact)
+
+
+def _binary_config_path(path: str) -> str:
+    """
+    Returns the path of the precompiled (MessagePack) sibling of a YAML config file.
+    """
+    return os.path.splitext(path)[0] + ".msgpack"
+
+
+def _open_with_readahead(path: str):
+    """
+    Opens a file for binary reading after asking the kernel to prefetch it (POSIX_FADV_WILLNEED),
+    so the read overlaps with import work on slow overlay/NFS storage.
+    """
+    fd = os.open(path, os.O_RDONLY | getattr(os, "O_BINARY", 0))
+    if hasattr(os, "posix_fadvise"):
+        try:
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_WILLNEED)
+        except OSError:
+            # Only a hint; some filesystems reject it
+            pass
+    try:
+        return os.fdopen(fd, "rb")
+    except BaseException:
+        os.close(fd)
+        raise
+
+
+def _read_source(path: str) -> bytes:
+    with _open_with_readahead(path) as file:
+        return file.read()
+
+
+def _source_digest(source: bytes) -> str:
+    """
+    Identifies a YAML source by content; mtimes survive `COPY`s and have coarse resolution on some filesystems.
+    """
+    return hashlib.blake2b(source, digest_size=16).hexdigest()
+
+
+def _parse_yaml(source: bytes) -> dict:
+    return yaml.load(source, Loader=_Loader) or {}
+
+
+def _write_binary_config(binary_path: str, config: dict, source_digest: str) -> None:
+    """
+    Atomically writes the config as MessagePack, tagged with the digest of its YAML source, next to that source.
+    Raises ValueError if the config holds values MessagePack would not round-trip (e.g. YAML dates).
+    """
+    payload = _ARTIFACT_ENCODER.encode(
+        _ConfigArtifact(version=_ARTIFACT_VERSION, source_digest=source_digest, config=config)
+    )
+    if _ARTIFACT_DECODER.decode(payload).config != config:
+        raise ValueError("Config values do not round-trip through MessagePack")
+
+    directory, name = os.path.split(binary_path)
+    fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=name, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as file:
+            file.write(payload)
+        # mkstemp creates 0600; the artifact is often built by another user (CI, image build) than the app
+        os.chmod(tmp_path, 0o644)
+        os.replace(tmp_path, binary_path)
+    except BaseException:
+        # fd is closed by now, so the unlink also succeeds on Windows; never mask the original error
+        with suppress(OSError):
+            os.unlink(tmp_path)
+        raise
+
+
+def _read_binary_config(binary_path: str, source_digest: str) -> Optional[dict]:
+    """
+    Returns the precompiled config if the artifact was built from exactly this YAML source, else None.
+    """
+    try:
+        with _open_with_readahead(binary_path) as file:
+            artifact = _ARTIFACT_DECODER.decode(file.read())
+    except (OSError, msgspec.DecodeError):
+        # Missing, truncated, corrupt or foreign artifact: rebuild it from the YAML
+        return None
+
+    if artifact.version == _ARTIFACT_VERSION and artifact.source_digest == source_digest:
+        return artifact.config
+    return None
+
+
+def compile_config(config_path: str | None = None) -> str:
+    """
+    Parses the YAML config and writes its precompiled artifact; returns the artifact path.
+    """
+    path = _resolve_config_path(config_path)
+    binary_path = _binary_config_path(path)
+    source = _read_source(path)
+    _write_binary_config(binary_path, _parse_yaml(source), _source_digest(source))
+    return binary_path
+
+
+def _load_raw_config(resolved_path: str) -> dict:
+    binary_path = _binary_config_path(resolved_path)
+    source = _read_source(resolved_path)
+    digest = _source_digest(source)
+
+    # An artifact built from byte-identical YAML skips parsing entirely
+    config = _read_binary_config(binary_path, digest)
+    if config is not None:
+        return config
+
+    config = _parse_yaml(source)
+    try:
+        _write_binary_config(binary_path, config, digest)
+    except Exception:
+        # Read-only config directory, non-serializable values or any other write failure:
+        # the artifact is only an optimization, so keep serving the parsed YAML
+        pass
+    return config
+
+
+@lru_cache(maxsize=8)
+def _load_config_cached(resolved_path: str) -> AppConfig:
+    return AppConfig.from_dict(_load_raw_config(resolved_path))
+
+
+def load_config(config_path: str | None = None) -> AppConfig:
+    """
+    Loads a YAML configuration file with reliable path resolution,
+    regardless of the current working directory.
+    Each file is parsed and validated once per process; the returned AppConfig is immutable and shared.
+    Use `load_config.cache_clear()` to force a re-read.
+    """
+    return _load_config_cached(_resolve_config_path(config_path))
+
 
-    path = Path(config_path)
-    if not path.is_absolute():
-        path = get_project_root() / path
+load_config.cache_clear = _load_config_cached.cache_clear
 
-    if not path.exists():
-        raise FileNotFoundError(f"Config file not found: {path}")
 
-    with open(path, "r", encoding="utf-8") as file:
-        return yaml.safe_load(file) or {}
-    
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="EstateRAG configuration loader")
+    parser.add_argument("config_path", nargs="?", help="YAML config file (defaults to CONFIG_PATH or config/config.yaml)")
+    parser.add_argument("--compile", action="store_true", help="write the precompiled .msgpack artifact for CI/deploys")
+    args = parser.parse_args()
 
-# if __name__ == "__main__":
-#     config = load_config(str(get_project_root() / "config" / "config.yaml"))
-#     print(config)
\ No newline at end of file
+    if args.compile:
+        print(f"Compiled config written to: {compile_config(args.config_path)}")
+    else:
+        print(load_config(args.config_path))
@@ -0,0 +1,25 @@
+import os
+from typing import Dict, Optional
+
+# Frozen copy of os.environ, populated by snapshot_environment() when ESTATE_CACHE_ENV=1
+_ENV_SNAPSHOT: Optional[Dict[str, str]] = None
+
+
+def snapshot_environment() -> None:
+    """
+    Freezes the current environment into an in-process snapshot when ESTATE_CACHE_ENV=1.
+    Only the first call takes the snapshot, so every later reader sees the same values.
+    Call after .env loading so the snapshot includes those values.
+    """
+    global _ENV_SNAPSHOT
+    if _ENV_SNAPSHOT is None and os.getenv("ESTATE_CACHE_ENV") == "1":
+        _ENV_SNAPSHOT = dict(os.environ)
+
+
+def getenv(key: str, default: Optional[str] = None) -> Optional[str]:
+    """
+    Drop-in for os.getenv that reads from the snapshot once one has been taken.
+    """
+    if _ENV_SNAPSHOT is not None:
+        return _ENV_SNAPSHOT.get(key, default)
+    return os.getenv(key, default)
@@ -1,5 +1,5 @@
 from datetime import datetime, timezone
-import uuid
+import os
 from core.estate_exception import EstateRAGException
 from logger import LOGGER as log
 
@@ -9,15 +9,16 @@ SUPPORTED_EXTENSIONS = {".pdf", ".docx", ".txt"}
 
 def generate_session_id(prefix: str = "estate_session") -> str:
     """
-    Generates a unique session ID using UTC timestamp and UUID.
+    Generates a unique session ID using UTC timestamp and 32 random bits.
     Useful for organizing estate document sessions.
     """
     try:
-        timestamp = datetime.now(timezone.utc).strftime('%Y%m%d_%H%M%S')
-        unique_id = uuid.uuid4().hex[:8]
+        t = datetime.now(timezone.utc)
+        timestamp = f"{t.year:04d}{t.month:02d}{t.day:02d}_{t.hour:02d}{t.minute:02d}{t.second:02d}"
+        unique_id = os.urandom(4).hex()
         session_id = f"{prefix}_{timestamp}_{unique_id}"
         
-        log.info("Generated session ID", extra={"session_id": session_id})
+        log.debug("Generated session ID", extra={"session_id": session_id})
         return session_id
 
     except Exception as e:
@@ -1,31 +1,48 @@
-import os
-import sys
-import json
-from typing import Dict
+import logging
+import functools
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Dict, FrozenSet, Tuple
 
+import orjson
 from dotenv import load_dotenv
-from utils.config_loader import load_config
-from langchain_google_genai import GoogleGenerativeAIEmbeddings, ChatGoogleGenerativeAI
-from langchain_groq import ChatGroq
+from utils.config_loader import LLMProviderCfg, load_config
+from utils.environment import getenv, snapshot_environment
 from core.estate_exception import EstateRAGException
 from logger import LOGGER as log
 
+# Provider SDKs pull in large dependency trees; they are imported only when a model is loaded
+if TYPE_CHECKING:
+    from langchain_core.language_models import BaseChatModel
+    from langchain_google_genai import GoogleGenerativeAIEmbeddings
+
+# .env is read at most once per process, however many loaders are created
+_DOTENV_LOADED = False
+
+
+@functools.lru_cache(maxsize=1)
+def _parse_api_keys_blob(blob: str) -> dict:
+    """
+    Decodes the API_KEYS secret once per distinct value; callers must not mutate the result.
+    """
+    return orjson.loads(blob)
+
+
 class ApiKeyManager:
     """
     Manages retrieval and validation of required API keys from environment variables or secrets.
     """
-    REQUIRED_KEYS = ["GROQ_API_KEY", "GOOGLE_API_KEY"]
+    REQUIRED_KEYS: FrozenSet[str] = frozenset({"GROQ_API_KEY", "GOOGLE_API_KEY"})
 
     def __init__(self) -> None:
         self.api_keys: Dict[str, str] = {}
         self._load_api_keys()
 
     def _load_api_keys(self) -> None:
-        raw_keys = os.getenv("API_KEYS")
+        raw_keys = getenv("API_KEYS")
 
         if raw_keys:
             try:
-                parsed = json.loads(raw_keys)
+                parsed = _parse_api_keys_blob(raw_keys)
                 if not isinstance(parsed, dict):
                     raise ValueError("API_KEYS must be a JSON object")
                 self.api_keys.update(parsed)
@@ -33,21 +50,21 @@ class ApiKeyManager:
             except Exception as e:
                 log.warning("Failed to parse API_KEYS", error=str(e))
 
-        for key in self.REQUIRED_KEYS:
-            if key not in self.api_keys:
-                env_val = os.getenv(key)
-                if env_val:
-                    self.api_keys[key] = env_val
-                    log.info(f"API key '{key}' loaded from environment variable")
+        # Only keys the secret did not provide fall back to individual environment variables
+        for key in self.REQUIRED_KEYS - self.api_keys.keys():
+            env_val = getenv(key)
+            if env_val:
+                self.api_keys[key] = env_val
+                log.debug(f"API key '{key}' loaded from environment variable")
 
-        missing_keys = [k for k in self.REQUIRED_KEYS if k not in self.api_keys]
+        missing_keys = self.REQUIRED_KEYS - self.api_keys.keys()
         if missing_keys:
-            log.error("Missing required API keys", missing_keys=missing_keys)
-            raise EstateRAGException("Missing API keys", sys)
+            log.error("Missing required API keys", missing_keys=sorted(missing_keys))
+            raise EstateRAGException(f"Missing API keys: {sorted(missing_keys)}")
 
-        # Masked logging for security
-        masked_keys = {k: v[:6] + "..." for k, v in self.api_keys.items()}
-        log.info("API keys successfully loaded", keys=masked_keys)
+        # Masked logging for security; skip building the masked dict when INFO is filtered out
+        if log.is_enabled_for(logging.INFO):
+            log.info("API keys successfully loaded", keys={k: v[:6] + "..." for k, v in self.api_keys.items()})
 
     def get(self, key: str) -> str:
         """
@@ -61,28 +78,86 @@ class ApiKeyManager:
 class ModelLoader:
     """
     Loads embedding and LLM models based on configuration and environment.
+    Use `ModelLoader.instance()` to share one loader, and its `embeddings`/`llm` clients, per process.
     """
 
     def __init__(self) -> None:
         self._initialize_environment()
         self.api_key_mgr = ApiKeyManager()
         self.config = load_config()
-        log.info("Configuration loaded", config_keys=list(self.config.keys()))
+        log.debug("Configuration loaded", llm_providers=list(self.config.llm))
+
+    @classmethod
+    @functools.lru_cache(maxsize=1)
+    def instance(cls) -> "ModelLoader":
+        """
+        Return the process-wide ModelLoader, creating it on first use.
+        """
+        return cls()
+
+    @functools.cached_property
+    def embeddings(self) -> "GoogleGenerativeAIEmbeddings":
+        """
+        Embedding client built once per loader.
+        """
+        return self.load_embeddings()
+
+    @functools.cached_property
+    def llm(self):
+        """
+        LLM client built once per loader.
+        """
+        return self.load_llm()
+
+    @functools.cached_property
+    def llm_id(self) -> str:
+        """
+        Identifies the configured LLM (provider, model and generation settings), e.g. for cache keys.
+        """
+        cfg = self._llm_settings()
+        return f"{cfg.provider}:{cfg.model_name}:temperature={cfg.temperature}:max_output_tokens={cfg.max_output_tokens}"
+
+    def _llm_settings(self) -> LLMProviderCfg:
+        """
+        Returns the `llm` config entry selected by LLM_PROVIDER.
+        """
+        provider_key = getenv("LLM_PROVIDER", "google")
+        if provider_key not in self.config.llm:
+            raise ValueError(f"LLM provider '{provider_key}' not found in configuration")
+        return self.config.llm[provider_key]
+
+    def warm_up(self) -> Tuple["GoogleGenerativeAIEmbeddings", "BaseChatModel"]:
+        """
+        Build the embedding and LLM clients concurrently; both stay cached on the loader.
+        The embeddings are built on the calling thread: GoogleGenerativeAIEmbeddings creates its
+        grpc-asyncio client eagerly, which needs (and binds to) the caller's event loop.
+        """
+        # Client construction is network-bound (auth, handshakes), so the LLM overlaps well in a worker thread
+        with ThreadPoolExecutor(max_workers=1, thread_name_prefix="estate-rag-warm-up") as executor:
+            llm = executor.submit(getattr, self, "llm")
+            embeddings = self.embeddings
+            return embeddings, llm.result()
 
     def _initialize_environment(self) -> None:
-        env = os.getenv("ENV", "local").lower()
+        global _DOTENV_LOADED
+        env = getenv("ENV", "local").lower()
         if env != "production":
-            load_dotenv()
+            if not _DOTENV_LOADED:
+                load_dotenv()
+                _DOTENV_LOADED = True
             log.info("Environment: LOCAL (.env loaded)")
         else:
             log.info("Environment: PRODUCTION")
+        snapshot_environment()
 
-    def load_embeddings(self) -> GoogleGenerativeAIEmbeddings:
+    def load_embeddings(self) -> "GoogleGenerativeAIEmbeddings":
         """
         Load Google Generative AI embedding model.
         """
         try:
-            model_name = self.config["embedding_model"]["model_name"]
+            from langchain_google_genai import GoogleGenerativeAIEmbeddings
+
+            model_name = self.config.embedding_model.model_name
             log.info("Initializing embedding model", model=model_name)
             return GoogleGenerativeAIEmbeddings(
                 model=model_name,
@@ -90,28 +165,23 @@ class ModelLoader:
             )
         except Exception as e:
             log.error("Failed to initialize embedding model", error=str(e))
-            raise EstateRAGException("Embedding model initialization failed", sys)
+            raise EstateRAGException("Embedding model initialization failed", e) from e
 
     def load_llm(self):
         """
         Load the configured LLM model based on provider.
         """
         try:
-            llm_config_block = self.config["llm"]
-            provider_key = os.getenv("LLM_PROVIDER", "google")
-
-            if provider_key not in llm_config_block:
-                raise ValueError(f"LLM provider '{provider_key}' not found in configuration")
-
-            llm_config = llm_config_block[provider_key]
-            provider = llm_config.get("provider")
-            model_name = llm_config.get("model_name")
-            temperature = llm_config.get("temperature", 0.2)
-            max_tokens = llm_config.get("max_output_tokens", 2048)
+            cfg = self._llm_settings()
+            provider = cfg.provider
+            model_name = cfg.model_name
+            temperature = cfg.temperature
+            max_tokens = cfg.max_output_tokens
 
             log.info("Initializing LLM", provider=provider, model=model_name)
 
             if provider == "google":
+                from langchain_google_genai import ChatGoogleGenerativeAI
                 return ChatGoogleGenerativeAI(
                     model=model_name,
                     google_api_key=self.api_key_mgr.get("GOOGLE_API_KEY"),
@@ -119,6 +189,7 @@ class ModelLoader:
                     max_output_tokens=max_tokens
                 )
             elif provider == "groq":
+                from langchain_groq import ChatGroq
                 return ChatGroq(
                     model=model_name,
                     api_key=self.api_key_mgr.get("GROQ_API_KEY"),
@@ -129,21 +200,22 @@ class ModelLoader:
 
         except Exception as e:
             log.error("Failed to initialize LLM", error=str(e))
-            raise EstateRAGException("LLM initialization failed", sys)
+            raise EstateRAGException("LLM initialization failed", e) from e
 
 
 if __name__ == "__main__":
+    import sys
+
     try:
-        loader = ModelLoader()
+        loader = ModelLoader.instance()
+        embeddings, llm = loader.warm_up()
 
         # Embedding Test
-        embeddings = loader.load_embeddings()
         print(f"✅ Embedding Model Loaded: {embeddings}")
         result = embeddings.embed_query("Hello, how are you?")
         print(f"🔍 Embedding Result: {result}")
 
         # LLM Test
-        llm = loader.load_llm()
         print(f"✅ LLM Loaded: {llm}")
         response = llm.invoke("Hello, how are you?")
         print(f"💬 LLM Response: {response.content}")
@@ -0,0 +1,226 @@
+import hashlib
+import os
+import sqlite3
+import threading
+from typing import TYPE_CHECKING, Any, Callable, List, Optional
+
+import orjson
+from logger import LOGGER as log
+
+# numpy/faiss are only needed by the semantic tier; they are imported when it is enabled
+if TYPE_CHECKING:
+    import numpy as np
+
+
+# Namespaces whose answers depend on small differences between near-identical inputs
+# (e.g. a diff of two leases); a "similar enough" match would return another input's answer.
+EXACT_ONLY_NAMESPACES = frozenset({"estate_document_comparison"})
+
+
+class LLMResponseCache:
+    """
+    Two-tier cache for LLM chain responses.
+    Exact tier: SHA-256 of the input text looked up in SQLite.
+    Semantic tier (opt-in): cosine similarity of the input embedding against a FAISS index of cached inputs.
+    Cache failures, including setup failures, only log a warning and fall through to the LLM.
+    """
+
+    def __init__(
+        self,
+        namespace: str,
+        db_path: str,
+        embeddings=None,
+        similarity_threshold: float = 0.95,
+        enabled: bool = True,
+    ):
+        self.namespace = namespace
+        self.embeddings = embeddings
+        self.similarity_threshold = similarity_threshold
+        self.enabled = enabled
+
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+        self._index = None
+        self._index_keys: List[str] = []
+
+        if not self.enabled:
+            return
+
+        try:
+            os.makedirs(os.path.dirname(os.path.abspath(db_path)), exist_ok=True)
+            self._conn = sqlite3.connect(db_path, check_same_thread=False)
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS cache ("
+                "namespace TEXT NOT NULL, key TEXT NOT NULL, response BLOB NOT NULL, embedding BLOB, "
+                "PRIMARY KEY (namespace, key))"
+            )
+            self._conn.commit()
+        except Exception as e:
+            log.warning("LLM response cache unavailable, caching disabled", extra={
+                "namespace": self.namespace,
+                "db_path": db_path,
+                "error": str(e)
+            })
+            self._disable()
+            return
+
+        if self.embeddings is not None:
+            try:
+                self._load_index()
+            except Exception as e:
+                log.warning("Semantic cache index unavailable, using exact tier only", extra={
+                    "namespace": self.namespace,
+                    "error": str(e)
+                })
+                self.embeddings = None
+                self._index = None
+                self._index_keys = []
+
+        log.info("LLMResponseCache initialized", extra={
+            "namespace": self.namespace,
+            "db_path": db_path,
+            "semantic": self.embeddings is not None,
+            "indexed": len(self._index_keys)
+        })
+
+    @classmethod
+    def from_config(cls, namespace: str, loader, fingerprint: Optional[str] = None) -> "LLMResponseCache":
+        """
+        Build a cache from the `response_cache` block of the loader's configuration.
+        `fingerprint` identifies what produced the answers (model, prompt, format instructions);
+        entries are scoped to it, so changing any of them starts from an empty cache.
+        Never raises: on any setup failure the returned cache is disabled.
+        """
+        scoped_namespace = f"{namespace}:{fingerprint}" if fingerprint else namespace
+        try:
+            cfg = loader.config.response_cache
+            semantic = cfg.enabled and cfg.semantic and namespace not in EXACT_ONLY_NAMESPACES
+
+            embeddings = None
+            if semantic:
+                try:
+                    embeddings = loader.embeddings
+                except Exception as e:
+                    log.warning("Embedding client unavailable, semantic cache disabled", extra={
+                        "namespace": namespace,
+                        "error": str(e)
+                    })
+
+            return cls(
+                scoped_namespace,
+                db_path=cfg.db_path,
+                embeddings=embeddings,
+                similarity_threshold=cfg.similarity_threshold,
+                enabled=cfg.enabled,
+            )
+        except Exception as e:
+            log.warning("LLM response cache setup failed, caching disabled", extra={
+                "namespace": namespace,
+                "error": str(e)
+            })
+            return cls(scoped_namespace, db_path="", enabled=False)
+
+    def get_or_compute(self, text: str, compute: Callable[[], Any]) -> Any:
+        """
+        Return the cached response for `text`, invoking `compute` and storing its result on a miss.
+        """
+        if not self.enabled:
+            return compute()
+
+        key = hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+        cached = self._get_exact(key)
+        if cached is not None:
+            log.info("LLM response cache hit", extra={"namespace": self.namespace, "tier": "exact"})
+            return cached
+
+        vector = self._embed(text)
+        if vector is not None:
+            cached = self._get_semantic(vector)
+            if cached is not None:
+                log.info("LLM response cache hit", extra={"namespace": self.namespace, "tier": "semantic"})
+                return cached
+
+        response = compute()
+        self._put(key, response, vector)
+        return response
+
+    def _disable(self) -> None:
+        self.enabled = False
+        self.embeddings = None
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+    def _load_index(self) -> None:
+        import numpy as np
+
+        rows = self._conn.execute(
+            "SELECT key, embedding FROM cache WHERE namespace=? AND embedding IS NOT NULL",
+            (self.namespace,)
+        ).fetchall()
+
+        for key, blob in rows:
+            self._add_to_index(key, np.frombuffer(blob, dtype=np.float32))
+
+    def _add_to_index(self, key: str, vector: "np.ndarray") -> None:
+        if self._index is None:
+            import faiss
+            self._index = faiss.IndexFlatIP(vector.shape[0])
+        elif self._index.d != vector.shape[0]:
+            # Embedding model changed since this entry was stored; it can no longer be compared.
+            return
+        self._index.add(vector.reshape(1, -1))
+        self._index_keys.append(key)
+
+    def _embed(self, text: str) -> Optional["np.ndarray"]:
+        if self.embeddings is None:
+            return None
+        try:
+            import numpy as np
+
+            vector = np.asarray(self.embeddings.embed_query(text), dtype=np.float32)
+            norm = np.linalg.norm(vector)
+            return vector / norm if norm else None
+        except Exception as e:
+            log.warning("Embedding for semantic cache lookup failed", extra={
+                "namespace": self.namespace,
+                "error": str(e)
+            })
+            return None
+
+    def _get_exact(self, key: str) -> Any:
+        try:
+            with self._lock:
+                row = self._conn.execute(
+                    "SELECT response FROM cache WHERE namespace=? AND key=?",
+                    (self.namespace, key)
+                ).fetchone()
+            return orjson.loads(row[0]) if row else None
+        except Exception as e:
+            log.warning("LLM response cache lookup failed", extra={"namespace": self.namespace, "error": str(e)})
+            return None
+
+    def _get_semantic(self, vector: "np.ndarray") -> Any:
+        with self._lock:
+            if self._index is None or self._index.ntotal == 0 or self._index.d != vector.shape[0]:
+                return None
+            scores, ids = self._index.search(vector.reshape(1, -1), 1)
+            if ids[0][0] < 0 or scores[0][0] < self.similarity_threshold:
+                return None
+            key = self._index_keys[ids[0][0]]
+        return self._get_exact(key)
+
+    def _put(self, key: str, response: Any, vector: Optional["np.ndarray"]) -> None:
+        try:
+            payload = orjson.dumps(response)
+            with self._lock:
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO cache (namespace, key, response, embedding) VALUES (?, ?, ?, ?)",
+                    (self.namespace, key, payload, vector.tobytes() if vector is not None else None)
+                )
+                self._conn.commit()
+                if vector is not None:
+                    self._add_to_index(key, vector)
+        except Exception as e:
+            log.warning("Failed to store LLM response in cache", extra={"namespace": self.namespace, "error": str(e)})